@@ -0,0 +1,57 @@
+# bulk1.py — 전체 유니버스 Yahoo 일괄 다운로드 (가격·배당)
+
+import pandas as pd
+import yfinance as yf
+from typing import Dict, List
+
+FX_SYMBOL = "USDKRW=X"
+FIELDS = ["Close", "Dividends"]
+
+def split_download(raw: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """yf.download(group_by='ticker') 결과 → 티커별 (Close, Dividends) 열 프레임"""
+    out = {}
+    if raw is None or raw.empty:
+        return out
+    if not isinstance(raw.columns, pd.MultiIndex):
+        # 심볼이 하나면 단일 레벨 열로 내려옴
+        raw = pd.concat({symbols[0]: raw}, axis=1)
+    present = set(raw.columns.get_level_values(0))
+    for sym in symbols:
+        if sym not in present:
+            continue
+        sub = raw[sym].reindex(columns=FIELDS)
+        sub = sub.dropna(how="all")
+        if sub.empty:
+            continue
+        idx = pd.to_datetime(sub.index)
+        if idx.tz is not None:
+            idx = idx.tz_localize(None)
+        sub.index = idx.normalize()
+        sub["Dividends"] = sub["Dividends"].fillna(0.0)
+        out[sym] = sub
+    return out
+
+def download_universe(tickers: List[str], period: str = "max") -> Dict[str, pd.DataFrame]:
+    """
+    펀드 전체를 한 번의 yf.download 로 받아 티커별 프레임으로 분리.
+    (yfinance 가 내부에서 심볼별 요청을 스레드로 병렬 처리하므로 심볼당 1회 요청)
+    환율(FX_SYMBOL)은 최근 며칠만 필요하므로 전체 기간 다운로드에 넣지 않음.
+    요청 수는 줄지 않으므로 주기적 갱신은 짧은 period 로 받아 merge_frames 로 합칠 것.
+    """
+    symbols = sorted(tickers)
+    raw = yf.download(
+        symbols, period=period, interval="1d", actions=True, auto_adjust=False,
+        group_by="ticker", threads=True, progress=False,
+    )
+    return split_download(raw, symbols)
+
+def merge_frames(base: Dict[str, pd.DataFrame], recent: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """전체 기간 프레임에 최근 구간 프레임을 덮어씀 (겹치는 날짜는 최근 값 우선, 새 티커는 추가)"""
+    out = dict(base)
+    for sym, sub in recent.items():
+        old = base.get(sym)
+        if old is None or old.empty:
+            out[sym] = sub
+            continue
+        out[sym] = pd.concat([old[old.index < sub.index.min()], sub])
+    return out
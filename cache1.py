@@ -0,0 +1,549 @@
+# cache1.py — 공유 캐시 백엔드 (프로세스 내 LRU / 호스트 공유 디스크 / 네트워크 KV)
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+import requests
+
+VERSION_KEY = "__cache_version__"
+
+# -----------------------------
+# 직렬화 (데이터 전용 JSON, pickle 금지)
+# -----------------------------
+def _encode_array(values) -> dict:
+    """Index/Series 값 → {'dtype', ...} (날짜는 epoch ns 정수 + 해상도·시간대)"""
+    if isinstance(values, pd.RangeIndex):
+        return {"dtype": "range", "start": values.start, "stop": values.stop, "step": values.step}
+    dtype = values.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        idx = pd.DatetimeIndex(values)
+        nat = idx.isna()
+        return {
+            "dtype": "datetime",
+            "unit": idx.unit,
+            "tz": str(idx.tz) if idx.tz is not None else None,
+            "values": [None if n else v for v, n in zip(idx.as_unit("ns").asi8.tolist(), nat)],
+        }
+    return {"dtype": str(dtype), "values": np.asarray(values).tolist()}
+
+def _decode_array(payload: dict):
+    if payload["dtype"] == "range":
+        return pd.RangeIndex(payload["start"], payload["stop"], payload["step"])
+    if payload["dtype"] == "datetime":
+        tz = payload["tz"]
+        idx = pd.to_datetime(payload["values"], unit="ns", utc=tz is not None).as_unit(payload["unit"])
+        return idx.tz_convert(tz) if tz else idx
+    return pd.array(payload["values"], dtype=payload["dtype"])
+
+def _encode_frame(df: pd.DataFrame) -> dict:
+    return {
+        "columns": [str(c) for c in df.columns],
+        "data": [_encode_array(df[c]) for c in df.columns],
+        "index": _encode_array(df.index),
+        "index_name": df.index.name,
+    }
+
+def _decode_frame(payload: dict) -> pd.DataFrame:
+    index = _decode_array(payload["index"])
+    index = index if isinstance(index, pd.RangeIndex) else pd.Index(index)
+    index.name = payload["index_name"]
+    data = {c: _decode_array(col) for c, col in zip(payload["columns"], payload["data"])}
+    return pd.DataFrame(data, index=index, columns=payload["columns"])
+
+def encode_value(value: Any) -> Any:
+    """None·숫자·문자열·DataFrame·Series·dict 만 허용. 그 외 타입은 TypeError (캐시하지 않음)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"t": "json", "v": value}
+    if isinstance(value, (np.integer, np.floating)):
+        return {"t": "json", "v": value.item()}
+    if isinstance(value, pd.DataFrame):
+        return {"t": "df", "v": _encode_frame(value)}
+    if isinstance(value, pd.Series):
+        return {"t": "series", "name": value.name, "v": _encode_frame(value.to_frame("__v__"))}
+    if isinstance(value, dict):
+        return {"t": "dict", "v": {str(k): encode_value(v) for k, v in value.items()}}
+    raise TypeError(f"cache1 cannot serialize {type(value).__name__}")
+
+def decode_value(payload: Any) -> Any:
+    t = payload["t"]
+    if t == "json":
+        return payload["v"]
+    if t == "df":
+        return _decode_frame(payload["v"])
+    if t == "series":
+        s = _decode_frame(payload["v"])["__v__"]
+        s.name = payload["name"]
+        return s
+    if t == "dict":
+        return {k: decode_value(v) for k, v in payload["v"].items()}
+    raise ValueError(f"unknown cache payload type: {t}")
+
+def dumps(stored_at: float, value: Any) -> bytes:
+    return json.dumps({"stored_at": stored_at, "value": encode_value(value)}).encode("utf-8")
+
+def loads(raw: bytes):
+    obj = json.loads(raw)
+    return obj["stored_at"], decode_value(obj["value"])
+
+# -----------------------------
+# 백엔드 (bytes 저장소)
+# -----------------------------
+class CacheBackend:
+    """get/set/delete 만 제공하는 최소 KV 인터페이스 (값은 bytes, ttl 은 보관 기한 힌트)"""
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """프로세스 내 LRU (max_entries 초과 시 가장 오래 안 쓴 항목 제거)"""
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            v = self._data.get(key)
+            if v is not None:
+                self._data.move_to_end(key)
+            return v
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class DiskBackend(CacheBackend):
+    """
+    한 호스트의 여러 프로세스가 공유하는 SQLite 저장소 (SQLite 파일 잠금으로 동시성 보장).
+    항목마다 expires_at 을 저장하고, 쓰기 중 prune_interval 초마다 만료 행을 삭제
+    (이전 버전 키도 TTL 이 지나면 함께 정리됨).
+    """
+    def __init__(self, path: str = "polygon_cache.db", timeout: float = 10.0,
+                 default_ttl: float = 86400.0, prune_interval: float = 300.0):
+        self.path = path
+        self.timeout = timeout
+        self.default_ttl = default_ttl
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS kv_cache (
+            key TEXT PRIMARY KEY,
+            data BLOB,
+            last_updated REAL,
+            expires_at REAL
+        )""")
+        cols = {row[1] for row in conn.execute("PRAGMA table_info(kv_cache)")}
+        if "expires_at" not in cols:
+            conn.execute("ALTER TABLE kv_cache ADD COLUMN expires_at REAL")
+            conn.execute("DELETE FROM kv_cache")       # 이전 형식(pickle) 행 제거
+        conn.execute("CREATE INDEX IF NOT EXISTS kv_cache_expires ON kv_cache (expires_at)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._conn().execute(
+            "SELECT data FROM kv_cache WHERE key=? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "REPLACE INTO kv_cache (key,data,last_updated,expires_at) VALUES (?,?,?,?)",
+            (key, sqlite3.Binary(value), now, now + (ttl if ttl is not None else self.default_ttl)),
+        )
+        if now - self._last_prune >= self.prune_interval:
+            self._last_prune = now
+            conn.execute("DELETE FROM kv_cache WHERE expires_at <= ?", (now,))
+        conn.commit()
+
+    def delete(self, key):
+        conn = self._conn()
+        conn.execute("DELETE FROM kv_cache WHERE key=?", (key,))
+        conn.commit()
+
+    def prune(self) -> int:
+        """만료 행 즉시 삭제, 삭제된 행 수 반환"""
+        conn = self._conn()
+        cur = conn.execute("DELETE FROM kv_cache WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+        return cur.rowcount
+
+
+class HttpBackend(CacheBackend):
+    """
+    네트워크 KV: GET/PUT/DELETE {base_url}/{key} (로컬 HTTP 서버로 대체 테스트 가능).
+    ttl 은 X-Cache-TTL 헤더로 전달 → 저장소가 지원하면 만료 처리.
+    """
+    def __init__(self, base_url: str, timeout: float = 3.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def _url(self, key: str) -> str:
+        return f"{self.base_url}/{quote(key, safe='')}"
+
+    def get(self, key):
+        r = self._session.get(self._url(key), timeout=self.timeout)
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.content
+
+    def set(self, key, value, ttl=None):
+        headers = {"X-Cache-TTL": str(int(ttl))} if ttl is not None else {}
+        r = self._session.put(self._url(key), data=value, headers=headers, timeout=self.timeout)
+        r.raise_for_status()
+
+    def delete(self, key):
+        r = self._session.delete(self._url(key), timeout=self.timeout)
+        if r.status_code != 404:
+            r.raise_for_status()
+
+# -----------------------------
+# 버전 관리 캐시
+# -----------------------------
+class SharedCache:
+    """
+    백엔드 위에 TTL·버전을 얹은 캐시.
+    - 모든 키는 현재 버전(세대) 번호를 접두어로 가짐 → bump_version() 한 번으로 전체 무효화
+    - 로딩 도중 버전이 바뀌면 결과를 쓰지 않음 → 레플리카끼리 서로 다른 세대 데이터를 섞어 내보내지 않음
+    - 버전 번호는 version_ttl 초 동안 프로세스 안에 보관 (조회당 왕복 1회)
+    - 값은 JSON 으로만 저장 (저장소에 쓸 수 있는 누구도 레플리카에서 코드를 실행할 수 없음)
+    - 백엔드 장애 시에는 캐시 없이 loader 결과를 그대로 반환
+    """
+    def __init__(self, backend: CacheBackend, namespace: str = "ymdf", version_ttl: float = 5.0):
+        self.backend = backend
+        self.namespace = namespace
+        self.version_ttl = version_ttl
+        self._version: Optional[int] = None
+        self._version_at = 0.0
+
+    def _safe_get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.backend.get(key)
+        except Exception:
+            return None
+
+    def _safe_set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        try:
+            self.backend.set(key, value, ttl)
+        except Exception:
+            pass
+
+    def current_version(self, refresh: bool = False) -> int:
+        now = time.time()
+        if not refresh and self._version is not None and now - self._version_at < self.version_ttl:
+            return self._version
+        raw = self._safe_get(f"{self.namespace}:{VERSION_KEY}")
+        try:
+            v = int(raw) if raw is not None else 0
+        except ValueError:
+            v = 0
+        self._version, self._version_at = v, now
+        return v
+
+    def bump_version(self) -> int:
+        v = self.current_version(refresh=True) + 1
+        # 버전 키는 만료되면 안 되므로 충분히 긴 TTL
+        self._safe_set(f"{self.namespace}:{VERSION_KEY}", str(v).encode(), ttl=10 * 365 * 86400)
+        self._version, self._version_at = v, time.time()
+        return v
+
+    def _full_key(self, key: str, version: int) -> str:
+        return f"{self.namespace}:v{version}:{key}"
+
+    def get(self, key: str, ttl: float, default: Any = None, version: Optional[int] = None) -> Any:
+        if version is None:
+            version = self.current_version()
+        raw = self._safe_get(self._full_key(key, version))
+        if raw is None:
+            return default
+        try:
+            stored_at, value = loads(raw)
+        except Exception:
+            return default
+        if time.time() - stored_at >= ttl:
+            return default
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, version: Optional[int] = None) -> bool:
+        """version 을 넘기면 현재 버전과 같을 때만 기록 (다르면 False)"""
+        cur = self.current_version(refresh=version is not None)
+        if version is not None and version != cur:
+            return False
+        try:
+            raw = dumps(time.time(), value)
+        except (TypeError, ValueError):
+            return False
+        self._safe_set(self._full_key(key, cur), raw, ttl)
+        return True
+
+    def get_or_load(self, key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+        _miss = object()
+        version = self.current_version()
+        value = self.get(key, ttl, default=_miss, version=version)
+        if value is not _miss:
+            return value
+        value = loader()
+        self.set(key, value, ttl, version=version)
+        return value
+
+# -----------------------------
+# 메모리 예산 캐시 (프로세스 내 L1)
+# -----------------------------
+def estimate_size(value: Any) -> int:
+    """저장 객체의 바이트 크기 추정 (DataFrame/Series 는 deep memory_usage, dict 는 값의 합)"""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + estimate_size(v) for k, v in value.items()
+        )
+    mem = getattr(value, "memory_usage", None)
+    if callable(mem):
+        try:
+            used = mem(deep=True)
+            return int(used.sum()) if hasattr(used, "sum") else int(used)
+        except Exception:
+            pass
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "hits", "pinned")
+
+    def __init__(self, value, size, expires_at, pinned):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.hits = 0
+        self.pinned = pinned
+
+
+# 항목당 OrderedDict 슬롯·연결 노드 비용 (CPython 실측 약 115 바이트)
+_NODE_OVERHEAD = 120
+
+
+class MemoryBudgetCache:
+    """
+    전체 바이트 예산을 지키는 프로세스 내 캐시.
+    - 예산 초과 시 policy(lru | lfu)에 따라 일반 항목부터 제거, 그래도 넘치면 고정 항목도 제거
+    - 고정(pinned) 항목은 예산의 pin_fraction 까지만 유지 (초과분은 오래된 고정 항목부터 제거)
+    - 항목 크기 = 값 + 키 문자열 + _Entry·OrderedDict 노드 고정 비용 (None·float 같은 작은 값도 예산에 반영)
+    - 예산보다 큰 값은 저장하지 않음
+    - 만료는 get 에서 지연 처리 + sweep_interval 마다 한 번 전체 정리 (set 경로는 O(1))
+    - stats() 로 점유율·적중·제거 통계 확인
+    """
+    def __init__(self, budget_bytes: int, policy: str = "lru",
+                 pin_fraction: float = 0.5, sweep_interval: float = 60.0):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"unknown eviction policy: {policy}")
+        self.budget_bytes = budget_bytes
+        self.pin_budget = int(budget_bytes * pin_fraction)
+        self.policy = policy
+        self.sweep_interval = sweep_interval
+        # LFU 는 빈도 버킷에도 키 슬롯이 하나 더 생김
+        self._overhead = sys.getsizeof(_Entry(None, 0, 0.0, False)) + \
+            _NODE_OVERHEAD * (2 if policy == "lfu" else 1)
+        self._data: "OrderedDict[str, _Entry]" = OrderedDict()      # 일반 항목 (LRU 순서)
+        self._pinned: "OrderedDict[str, _Entry]" = OrderedDict()    # 고정 항목 (LRU 순서)
+        self._freq: "Dict[int, OrderedDict[str, None]]" = {}        # LFU: 적중 수 → 키 (오래된 순)
+        self._used = self._pinned_used = 0
+        self._last_sweep = time.time()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = self._rejected = 0
+
+    def entry_size(self, key: str, value: Any) -> int:
+        """예산에 계산되는 항목 하나의 바이트 크기"""
+        return estimate_size(value) + sys.getsizeof(key) + self._overhead
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        e = self._data.get(key)
+        return e if e is not None else self._pinned.get(key)
+
+    def _freq_add(self, key: str, hits: int) -> None:
+        self._freq.setdefault(hits, OrderedDict())[key] = None
+
+    def _freq_drop(self, key: str, hits: int) -> None:
+        bucket = self._freq.get(hits)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._freq[hits]
+
+    def _remove(self, key: str) -> None:
+        e = self._data.pop(key, None)
+        if e is not None:
+            if self.policy == "lfu":
+                self._freq_drop(key, e.hits)
+        else:
+            e = self._pinned.pop(key)
+            self._pinned_used -= e.size
+        self._used -= e.size
+
+    def _pick_victim(self, protect: Optional[str] = None) -> Optional[str]:
+        # 방금 넣은 항목(protect)은 LFU 에서 적중 0 이라 바로 밀려나지 않도록 건너뜀
+        if self.policy == "lfu":
+            for hits in sorted(self._freq):
+                for k in self._freq[hits]:
+                    if k != protect:
+                        return k
+            return None
+        for k in self._data:
+            if k != protect:
+                return k
+        return None
+
+    def _sweep(self, now: float) -> None:
+        for store in (self._data, self._pinned):
+            for k in [k for k, e in store.items() if e.expires_at <= now]:
+                self._remove(k)
+                self._expirations += 1
+        self._last_sweep = now
+
+    def _evict(self, protect: Optional[str] = None) -> None:
+        while self._pinned_used > self.pin_budget and self._pinned:
+            self._remove(next(iter(self._pinned)))
+            self._evictions += 1
+        while self._used > self.budget_bytes:
+            victim = self._pick_victim(protect)
+            if victim is None:
+                if not self._pinned:
+                    break
+                victim = next(iter(self._pinned))     # 고정 항목은 마지막에 제거
+            self._remove(victim)
+            self._evictions += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            e = self._lookup(key)
+            if e is None:
+                self._misses += 1
+                return default
+            if e.expires_at <= time.time():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return default
+            if e.pinned:
+                self._pinned.move_to_end(key)
+            else:
+                self._data.move_to_end(key)
+                if self.policy == "lfu":
+                    self._freq_drop(key, e.hits)
+                    self._freq_add(key, e.hits + 1)
+            e.hits += 1
+            self._hits += 1
+            return e.value
+
+    def set(self, key: str, value: Any, ttl: float, pin: bool = False) -> None:
+        size = self.entry_size(key, value)
+        with self._lock:
+            if self._lookup(key) is not None:
+                self._remove(key)
+            if size > self.budget_bytes:
+                self._rejected += 1
+                return
+            pin = pin and size <= self.pin_budget
+            now = time.time()
+            if now - self._last_sweep >= self.sweep_interval:
+                self._sweep(now)
+            e = _Entry(value, size, now + ttl, pin)
+            if pin:
+                self._pinned[key] = e
+                self._pinned_used += size
+            else:
+                self._data[key] = e
+                if self.policy == "lfu":
+                    self._freq_add(key, 0)
+            self._used += size
+            self._evict(protect=key)
+
+    def get_or_load(self, key: str, ttl: float, loader: Callable[[], Any], pin: bool = False) -> Any:
+        _miss = object()
+        value = self.get(key, default=_miss)
+        if value is not _miss:
+            return value
+        value = loader()
+        self.set(key, value, ttl, pin=pin)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data) + len(self._pinned),
+                "pinned": len(self._pinned),
+                "pinned_bytes": self._pinned_used,
+                "used_bytes": self._used,
+                "budget_bytes": self.budget_bytes,
+                "occupancy": (self._used / self.budget_bytes) if self.budget_bytes else 0.0,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected": self._rejected,
+                "policy": self.policy,
+            }
+
+# -----------------------------
+# 환경 변수로 백엔드 선택
+# -----------------------------
+def make_cache() -> SharedCache:
+    """
+    CACHE_BACKEND = memory | disk(기본) | http
+    CACHE_PATH    = disk 백엔드 SQLite 경로 (기본 polygon_cache.db)
+    CACHE_URL     = http 백엔드 주소 (예: http://cache:8080/kv)
+    """
+    kind = os.environ.get("CACHE_BACKEND", "disk").lower()
+    if kind == "memory":
+        backend = MemoryBackend()
+    elif kind == "http":
+        backend = HttpBackend(os.environ["CACHE_URL"])
+    else:
+        backend = DiskBackend(os.environ.get("CACHE_PATH", "polygon_cache.db"))
+    return SharedCache(backend, namespace=os.environ.get("CACHE_NAMESPACE", "ymdf"))
+
+
+def make_memory_cache() -> MemoryBudgetCache:
+    """
+    CACHE_MEMORY_MB = L1 메모리 예산 (기본 128MB)
+    CACHE_POLICY    = lru(기본) | lfu
+    CACHE_PIN_RATIO = 고정 티커가 차지할 수 있는 예산 비율 (기본 0.5)
+    """
+    budget_mb = float(os.environ.get("CACHE_MEMORY_MB", "128"))
+    return MemoryBudgetCache(
+        int(budget_mb * 1024 * 1024),
+        policy=os.environ.get("CACHE_POLICY", "lru").lower(),
+        pin_fraction=float(os.environ.get("CACHE_PIN_RATIO", "0.5")),
+    )
@@ -0,0 +1,113 @@
+# charts1.py — 전체 기간 차트 (서버 측 다운샘플링 + WebGL)
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from typing import Dict
+
+# -----------------------------
+# 다운샘플링
+# -----------------------------
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: 모양을 최대한 보존하는 n_out 개 점의 인덱스"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """구간별 최소·최대 점만 남기는 인덱스 (급등락 보존). 양 끝점 포함 최대 2 * n_buckets + 2 개"""
+    n = len(y)
+    if n <= 2 * n_buckets:
+        return np.arange(n)
+    idx = []
+    for chunk in np.array_split(np.arange(n), n_buckets):
+        seg = y[chunk]
+        idx.extend((chunk[seg.argmin()], chunk[seg.argmax()]))
+    return np.unique(np.array(idx + [0, n - 1]))
+
+
+def downsample_series(s: pd.Series, max_points: int, method: str = "lttb") -> pd.Series:
+    """DatetimeIndex 시리즈를 max_points 이하로 축소 (lttb·minmax 모두 max_points 개 이하 보장)"""
+    s = s.dropna()
+    if len(s) <= max_points:
+        return s
+    y = s.to_numpy(dtype=float)
+    if method == "minmax" and max_points >= 4:
+        # 양 끝점 2개를 위해 구간 수를 줄여 max_points 를 넘지 않도록
+        idx = minmax_indices(y, max(1, (max_points - 2) // 2))
+    else:
+        x = s.index.asi8.astype(float)
+        idx = lttb_indices(x, y, max_points)
+    return s.iloc[idx]
+
+
+def aggregate_dividends(s: pd.Series, max_bars: int) -> pd.Series:
+    """막대가 max_bars 를 넘으면 월 → 분기 합계로 묶어 막대 수 제한"""
+    s = s.dropna()
+    for rule in ("MS", "QS"):
+        if len(s) <= max_bars:
+            break
+        s = s.resample(rule).sum()
+        s = s[s > 0]
+    return s
+
+# -----------------------------
+# 차트 구성
+# -----------------------------
+def build_history_figure(
+    prices: Dict[str, pd.Series],
+    dividends: Dict[str, pd.Series],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    max_points: int = 600,
+    max_bars: int = 120,
+    normalize: bool = False,
+    method: str = "lttb",
+) -> go.Figure:
+    """
+    가격 선(Scattergl) + 배당 막대(보조 y축) 다중 티커 비교 차트.
+    보이는 구간(start~end)만 잘라 티커당 max_points 로 다운샘플링.
+    normalize=True 이면 가격을 구간 시작 대비 등락률(%)로 표시.
+    """
+    fig = go.Figure()
+    for t, s in prices.items():
+        s = s.loc[start:end]
+        if s.empty:
+            continue
+        if normalize:
+            s = (s / s.iloc[0] - 1) * 100
+        s = downsample_series(s, max_points, method)
+        fig.add_trace(go.Scattergl(x=s.index, y=s.values, mode="lines", name=f"{t} 주가"))
+
+    for t, s in dividends.items():
+        s = aggregate_dividends(s.loc[start:end], max_bars)
+        if s.empty:
+            continue
+        fig.add_trace(go.Bar(x=s.index, y=s.values, name=f"{t} 배당", yaxis="y2", opacity=0.45))
+
+    fig.update_layout(
+        plot_bgcolor="white",
+        barmode="group",
+        hovermode="x unified",
+        legend=dict(orientation="h", y=-0.2),
+        xaxis=dict(title="날짜", range=[start, end]),
+        yaxis=dict(title="주가 등락률(%)" if normalize else "주가(달러)", showgrid=False),
+        yaxis2=dict(title="배당금(달러)", overlaying="y", side="right", showgrid=False),
+    )
+    return fig
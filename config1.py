@@ -39,6 +39,32 @@ def build_ticker_map() -> Dict[str, Tuple[str, str, str]]:
 
 TICKER_TO_GROUP = build_ticker_map()
 
+# 메모리 캐시에서 제거하지 않고 고정할 인기 티커
+PINNED_TICKERS = frozenset(['ULTY', 'MSTY', 'TSLY'])
+
+# -----------------------------
+# 기초자산 (뉴스 조회용, 지수/멀티 ETF 는 생략)
+# -----------------------------
+UNDERLYING: Dict[str, str] = {
+    'ABNY': 'ABNB', 'AIYY': 'AI',   'AMDY': 'AMD',  'AMZY': 'AMZN', 'APLY': 'AAPL',
+    'BABO': 'BABA', 'BRKC': 'BRK-B','CONY': 'COIN', 'CRCO': 'CRCL', 'CRSH': 'TSLA',
+    'CVNY': 'CVNA', 'DIPS': 'NVDA', 'DISO': 'DIS',  'DRAY': 'DKNG', 'FBY':  'META',
+    'FIAT': 'COIN', 'GDXY': 'GDX',  'GMEY': 'GME',  'GOOY': 'GOOGL','HIYY': 'HIMS',
+    'HOOY': 'HOOD', 'JPMO': 'JPM',  'MARO': 'MARA', 'MRNY': 'MRNA', 'MSFO': 'MSFT',
+    'MSTY': 'MSTR', 'NFLY': 'NFLX', 'NVDY': 'NVDA', 'OARK': 'ARKK', 'PLTY': 'PLTR',
+    'PYPY': 'PYPL', 'RBLY': 'RBLX', 'RDYY': 'RDDT', 'SMCY': 'SMCI', 'SNOY': 'SNOW',
+    'TSLY': 'TSLA', 'TSMY': 'TSM',  'WNTR': 'MSTR', 'XOMO': 'XOM',  'XYZY': 'XYZ',
+    'YBIT': 'IBIT', 'YQQQ': 'QQQ',
+}
+
+# -----------------------------
+# 뉴스 RSS 소스 ({symbol} 자리에 펀드/기초자산 티커)
+# -----------------------------
+NEWS_FEEDS: List[str] = [
+    'https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US',
+    'https://news.google.com/rss/search?q={symbol}+stock&hl=en-US&gl=US&ceid=US:en',
+]
+
 # -----------------------------
 # 스케줄 정의
 # -----------------------------
@@ -5,14 +5,19 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import requests
-import feedparser
 import numpy as np
-import sqlite3, time, json, re
+import json, re
 from datetime import datetime, timedelta, date
 
 # 내 모듈
-from config1 import TICKER_TO_GROUP, SCHEDULE, US_MARKET_HOLIDAYS_2025
+from config1 import TICKER_TO_GROUP, GROUP_META, SCHEDULE, US_MARKET_HOLIDAYS_2025, PINNED_TICKERS, UNDERLYING, NEWS_FEEDS
 from time_utils1 import now_times, get_recent_next, hold_deadline_kst, KST, us_market_status
+from cache1 import SharedCache, MemoryBudgetCache, make_cache, make_memory_cache
+from optimizer1 import build_dividend_matrix, trailing_monthly_dividend, optimize_allocation
+from schedule_infer1 import ScheduleInferrer, WEEKDAY_KO
+from charts1 import build_history_figure
+from news1 import FeedAggregator, escape_md, safe_link
+from bulk1 import download_universe, merge_frames, FX_SYMBOL
 
 # -----------------------------
 # Polygon.io 설정
@@ -28,17 +33,36 @@ def polygon_get(endpoint, params=None):
     return r.json()
 
 # -----------------------------
-# DB 캐시 (SQLite)
+# 공유 캐시 (레플리카 간 공유, CACHE_BACKEND 로 선택)
 # -----------------------------
 @st.cache_resource
-def get_db():
-    conn = sqlite3.connect("polygon_cache.db", check_same_thread=False)
-    conn.execute("""CREATE TABLE IF NOT EXISTS dividends_cache (
-        ticker TEXT PRIMARY KEY,
-        data TEXT,
-        last_updated REAL
-    )""")
-    return conn
+def get_cache() -> SharedCache:
+    return make_cache()
+
+# -----------------------------
+# 메모리 예산 캐시 (프로세스 내, 크기 기반 제거)
+# -----------------------------
+@st.cache_resource
+def get_memo() -> MemoryBudgetCache:
+    return make_memory_cache()
+
+def cached_fetch(key: str, ttl: float, loader, ticker: str = None):
+    """L1(메모리 예산) → L2(공유 캐시) → loader 순으로 조회"""
+    return get_memo().get_or_load(
+        key, ttl,
+        lambda: get_cache().get_or_load(key, ttl, loader),
+        pin=ticker in PINNED_TICKERS,
+    )
+
+# -----------------------------
+# 뉴스 (백그라운드 수집, 화면은 메모리만 읽음)
+# -----------------------------
+@st.cache_resource
+def get_news() -> FeedAggregator:
+    symbols = {t: [t] + ([UNDERLYING[t]] if t in UNDERLYING else []) for t in TICKER_TO_GROUP}
+    agg = FeedAggregator(NEWS_FEEDS, symbols)
+    agg.start(interval=600)
+    return agg
 
 def tz_to_kst(df: pd.DataFrame, col: str) -> pd.DataFrame:
     if df.empty or col not in df.columns:
@@ -50,11 +74,70 @@ def tz_to_kst(df: pd.DataFrame, col: str) -> pd.DataFrame:
             df[col] = df[col].dt.tz_convert(KST)
     return df
 
+# -----------------------------
+# Yahoo 일괄 다운로드 (전체 유니버스 + 환율)
+# -----------------------------
+UNIVERSE_TTL = 7200                  # 최근 구간 갱신 주기
+UNIVERSE_FULL_TTL = 7 * 86400        # 전체 기간 재다운로드 주기
+UNIVERSE_REFRESH_PERIOD = "1mo"
+
+def _load_universe_frames() -> dict:
+    frames = download_universe(list(TICKER_TO_GROUP))
+    if not frames:
+        raise ValueError("empty universe download")
+    get_memo().set("yf_universe:fresh", True, UNIVERSE_TTL)
+    return frames
+
+def _refresh_universe_frames(frames: dict) -> bool:
+    """최근 UNIVERSE_REFRESH_PERIOD 만 받아 전체 기간 프레임에 덮어쓰고 L1·L2 갱신"""
+    recent = download_universe(list(TICKER_TO_GROUP), period=UNIVERSE_REFRESH_PERIOD)
+    if not recent:
+        raise ValueError("empty universe refresh")
+    merged = merge_frames(frames, recent)
+    get_cache().set("yf_universe", merged, UNIVERSE_FULL_TTL)
+    get_memo().set("yf_universe", merged, UNIVERSE_FULL_TTL)
+    return True
+
+def get_universe_frames() -> dict:
+    """
+    전체 기간은 UNIVERSE_FULL_TTL 마다 한 번만 받고, UNIVERSE_TTL 마다 최근 구간만 받아 합침
+    (심볼당 요청 수는 같지만 갱신 때마다 54개 펀드의 전체 이력을 다시 받지 않음).
+    실패하면 빈 결과를 캐시하지 않고 {} 반환 (티커별 개별 조회로 대체).
+    한 화면에서 여러 번 재시도하지 않도록 실패 표시만 60초간 L1 에 보관.
+    """
+    memo = get_memo()
+    if memo.get("yf_universe:failed") is not None:
+        return {}
+    try:
+        frames = cached_fetch("yf_universe", UNIVERSE_FULL_TTL, _load_universe_frames)
+    except Exception:
+        memo.set("yf_universe:failed", True, 60)
+        return {}
+    try:
+        # 갱신 표시는 레플리카별 L1 에만 (각자 보관 중인 프레임을 갱신해야 하므로)
+        memo.get_or_load("yf_universe:fresh", UNIVERSE_TTL, lambda: _refresh_universe_frames(frames))
+    except Exception:
+        memo.set("yf_universe:fresh", False, 60)      # 갱신 실패: 기존 프레임 유지, 60초 뒤 재시도
+        return frames
+    return memo.get("yf_universe", frames)
+
+def universe_frame(symbol: str):
+    """일괄 다운로드 결과에서 티커별 (Close, Dividends) 프레임, 없으면 None"""
+    return get_universe_frames().get(symbol)
+
 # -----------------------------
 # Yahoo Finance
 # -----------------------------
-@st.cache_data(ttl=7200, show_spinner=False)
-def fetch_yf_dividends_df(ticker: str) -> pd.DataFrame:
+def _load_yf_dividends_df(ticker: str) -> pd.DataFrame:
+    frame = universe_frame(ticker)
+    if frame is not None:
+        s = frame["Dividends"]
+        s = s[s > 0]
+        df = pd.DataFrame({
+            "배당락일": s.index.tz_localize("UTC").tz_convert(KST),
+            "배당금(달러)": s.to_numpy(dtype=float),
+        })
+        return df.sort_values("배당락일", ascending=False).reset_index(drop=True)
     try:
         s = yf.Ticker(ticker).dividends
         if s is None or s.empty:
@@ -68,24 +151,13 @@ def fetch_yf_dividends_df(ticker: str) -> pd.DataFrame:
     except Exception:
         return pd.DataFrame(columns=["배당락일", "배당금(달러)"])
 
+def fetch_yf_dividends_df(ticker: str) -> pd.DataFrame:
+    return cached_fetch(f"yf_div:{ticker}", 7200, lambda: _load_yf_dividends_df(ticker), ticker)
+
 # -----------------------------
 # Polygon
 # -----------------------------
-@st.cache_data(ttl=7200, show_spinner=False)
-def fetch_polygon_dividends_df(ticker: str) -> pd.DataFrame:
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("SELECT data,last_updated FROM dividends_cache WHERE ticker=?", (ticker,))
-    row = cur.fetchone()
-    now = time.time()
-
-    if row and now - row[1] < 7200:
-        try:
-            df = pd.read_json(row[0], orient="split")
-            return df
-        except Exception:
-            pass
-
+def _load_polygon_dividends_df(ticker: str) -> pd.DataFrame:
     rows = []
     try:
         data = polygon_get("/v3/reference/dividends", {"ticker": ticker})
@@ -104,19 +176,11 @@ def fetch_polygon_dividends_df(ticker: str) -> pd.DataFrame:
     if not df.empty:
         df["배당락일"] = pd.to_datetime(df["배당락일"]).dt.tz_localize("UTC").dt.tz_convert(KST)
         df = df.sort_values("배당락일", ascending=False).reset_index(drop=True)
-
-    try:
-        df_json = df.to_json(orient="split")
-        conn.execute(
-            "REPLACE INTO dividends_cache (ticker,data,last_updated) VALUES (?,?,?)",
-            (ticker, df_json, now),
-        )
-        conn.commit()
-    except Exception:
-        pass
-
     return df
 
+def fetch_polygon_dividends_df(ticker: str) -> pd.DataFrame:
+    return cached_fetch(f"polygon_div:{ticker}", 7200, lambda: _load_polygon_dividends_df(ticker), ticker)
+
 # -----------------------------
 # 조립
 # -----------------------------
@@ -183,6 +247,26 @@ def adjust_color(hex_color: str, factor: float = 0.9) -> str:
     adjusted = [max(0, min(255, int(c * factor))) for c in rgb]
     return '#{:02x}{:02x}{:02x}'.format(*adjusted)
 
+@st.cache_resource
+def get_schedule_inferrer() -> ScheduleInferrer:
+    return ScheduleInferrer()
+
+def seed_schedule_inferrer() -> None:
+    """
+    일괄 다운로드 프레임이 있으면 전체 티커 배당락일로 추론기를 채움 (UNIVERSE_TTL 마다 한 번, 증분 반영).
+    그래야 조회한 적 없는 티커만 있는 그룹도 처음부터 실제 스케줄을 따름.
+    """
+    memo = get_memo()
+    if memo.get("schedule:seeded") is not None:
+        return
+    frames = get_universe_frames()
+    if not frames:
+        return
+    get_schedule_inferrer().update_many(
+        {t: _load_yf_dividends_df(t) for t in frames if t in TICKER_TO_GROUP}
+    )
+    memo.set("schedule:seeded", True, UNIVERSE_TTL)
+
 def get_schedule(group_key: str):
     val = SCHEDULE.get(group_key, [])
     if isinstance(val, dict):
@@ -191,6 +275,20 @@ def get_schedule(group_key: str):
         dec_dates = val.get('dec_dates', [])
     else:
         ex_dates, pay_dates, dec_dates = val, [], []
+
+    # 실제 배당락일이 config 날짜와 ±2일 안에서 맞지 않거나 config 날짜가 모두 지났으면 추론 스케줄 사용
+    # (일괄 다운로드가 실패하면 이 프로세스에서 조회한 티커 이력만으로 추론 → 없으면 config 사용)
+    seed_schedule_inferrer()
+    inferrer = get_schedule_inferrer()
+    anchor = inferrer.group_anchor(group_key)
+    if anchor is not None:
+        today = pd.Timestamp.now(tz=KST).tz_localize(None).normalize()
+        ex_norm = [pd.Timestamp(d).normalize() for d in ex_dates]
+        consistent = any(abs((d - anchor).days) <= 2 for d in ex_norm)
+        if not consistent or not any(d > today for d in ex_norm):
+            inferred = inferrer.group_schedule(group_key)
+            if inferred:
+                return inferred['ex_dates'], inferred['pay_dates'], inferred['dec_dates']
     return ex_dates, pay_dates, dec_dates
 
 def fmt(d):
@@ -220,20 +318,42 @@ def fmt_dt(d):
 # -----------------------------
 # 환율
 # -----------------------------
-@st.cache_data(ttl=86400, show_spinner=False)
-def fetch_latest_fx() -> float:
+def _load_fx_closes() -> pd.Series:
+    """최근 5일 USDKRW 종가 (전체 기간 일괄 다운로드와 별개의 짧은 요청)"""
+    closes = yf.Ticker(FX_SYMBOL).history(period="5d")["Close"].dropna()
+    if closes.empty:
+        raise ValueError("empty FX history")
+    return closes
+
+def fetch_fx_closes() -> pd.Series:
     try:
-        hist = yf.Ticker("USDKRW=X").history(period="5d")
-        if hist.empty:
-            return 1350.0
-        return float(hist["Close"][-1])
+        return cached_fetch("fx:USDKRW", 86400, _load_fx_closes)
     except Exception:
-        return 1350.0
+        return pd.Series(dtype=float)
+
+def fetch_latest_fx() -> float:
+    closes = fetch_fx_closes()
+    return float(closes.iloc[-1]) if not closes.empty else 1350.0
 
 LATEST_FX = fetch_latest_fx()
 
-@st.cache_data(ttl=7200, show_spinner=False)
-def get_price_on_date(ticker: str, date_ts: pd.Timestamp) -> float:
+def _load_price_on_date(ticker: str, date_ts: pd.Timestamp) -> float:
+    frame = universe_frame(ticker)
+    if frame is not None:
+        closes = frame["Close"].dropna()
+        d = pd.Timestamp(date_ts)
+        if d.tzinfo is not None:
+            d = d.tz_localize(None)
+        d = d.normalize()
+        d_prev = d - pd.Timedelta(days=1)
+        window = closes.loc[d - pd.Timedelta(days=2):d]
+        if window.empty:
+            return None
+        if d_prev in window.index:
+            return float(window[d_prev])
+        if d in window.index:
+            return float(window[d])
+        return float(window.iloc[-1])
     try:
         start = (date_ts - pd.Timedelta(days=2)).strftime("%Y-%m-%d")
         end   = (date_ts + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
@@ -252,6 +372,84 @@ def get_price_on_date(ticker: str, date_ts: pd.Timestamp) -> float:
     except Exception:
         return None
 
+def get_price_on_date(ticker: str, date_ts: pd.Timestamp) -> float:
+    key = f"price:{ticker}:{pd.Timestamp(date_ts).isoformat()}"
+    return cached_fetch(key, 7200, lambda: _load_price_on_date(ticker, date_ts), ticker)
+
+# -----------------------------
+# 전체 기간 시계열 (차트용)
+# -----------------------------
+def _load_price_history(ticker: str) -> pd.Series:
+    frame = universe_frame(ticker)
+    if frame is not None:
+        return frame["Close"].dropna().astype("float32")
+    try:
+        hist = yf.Ticker(ticker).history(period="max", auto_adjust=False)
+        if hist.empty:
+            return pd.Series(dtype="float32")
+        s = hist["Close"].astype("float32")
+        s.index = pd.to_datetime(s.index).tz_localize(None).normalize()
+        return s
+    except Exception:
+        return pd.Series(dtype="float32")
+
+def fetch_price_history(ticker: str) -> pd.Series:
+    return cached_fetch(f"price_hist:{ticker}", 7200, lambda: _load_price_history(ticker), ticker)
+
+def dividend_series(ticker: str) -> pd.Series:
+    df = fetch_yf_dividends_df(ticker)
+    if df.empty:
+        return pd.Series(dtype=float)
+    idx = pd.to_datetime(df["배당락일"]).dt.tz_localize(None).dt.normalize()
+    return pd.Series(pd.to_numeric(df["배당금(달러)"], errors="coerce").to_numpy(), index=idx).sort_index()
+
+@st.cache_data(ttl=7200, max_entries=32, show_spinner=False)
+def history_chart(tickers: tuple, start: date, end: date, max_points: int,
+                  normalize: bool, method: str, show_div: bool):
+    """(티커 조합, 보이는 구간, 옵션) 단위로 다운샘플링된 차트 캐시"""
+    prices = {t: fetch_price_history(t) for t in tickers}
+    divs = {t: dividend_series(t) for t in tickers} if show_div else {}
+    return build_history_figure(
+        prices, divs, pd.Timestamp(start), pd.Timestamp(end),
+        max_points=max_points, normalize=normalize, method=method,
+    )
+
+# -----------------------------
+# 전체 유니버스 (목표 배당 최적화용)
+# -----------------------------
+def _load_universe_closes() -> pd.Series:
+    """TICKER_TO_GROUP 전체 최근 종가 (일괄 다운로드 결과 우선)"""
+    frames = get_universe_frames()
+    closes = {t: f["Close"].dropna() for t, f in frames.items() if t in TICKER_TO_GROUP}
+    closes = {t: float(c.iloc[-1]) for t, c in closes.items() if not c.empty}
+    if closes:
+        return pd.Series(closes)
+    try:
+        hist = yf.download(sorted(TICKER_TO_GROUP), period="5d", auto_adjust=False,
+                           progress=False, threads=True)
+        if hist.empty:
+            return pd.Series(dtype=float)
+        return hist["Close"].ffill().iloc[-1].astype(float)
+    except Exception:
+        return pd.Series(dtype=float)
+
+def fetch_universe_closes() -> pd.Series:
+    return cached_fetch("universe_closes", 7200, _load_universe_closes)
+
+@st.cache_data(ttl=7200, show_spinner="전체 ETF 배분 계산 중...")
+def compute_universe_allocation(asof: date, fx: float, target_krw: float,
+                                max_weight: float, g1_share, after_tax: bool):
+    """(날짜, 환율, 목표액, 제약) 단위로 메모이즈되는 최소 투자금 배분"""
+    div_matrix = build_dividend_matrix({t: fetch_yf_dividends_df(t) for t in TICKER_TO_GROUP})
+    monthly_div = trailing_monthly_dividend(div_matrix, pd.Timestamp(asof))
+    groups = pd.Series({t: info[0] for t, info in TICKER_TO_GROUP.items()})
+    group_mix = None if g1_share is None else {'G1': g1_share, 'G2': 1 - g1_share}
+    return optimize_allocation(
+        monthly_div, fetch_universe_closes(), groups, target_krw, fx,
+        max_weight=max_weight, group_mix=group_mix,
+        tax_rate=tax_rate if after_tax else 0.0,
+    )
+
 # -----------------------------
 # 세션 상태
 # -----------------------------
@@ -285,8 +483,8 @@ if not ticker:
         </div>
         """, height=120)
     with col2:
-        hist = yf.Ticker("USDKRW=X").history(period="5d")
-        fx_date = hist.index[-1].strftime("%Y-%m-%d") if not hist.empty else "알 수 없음"
+        fx_closes = fetch_fx_closes()
+        fx_date = fx_closes.index[-1].strftime("%Y-%m-%d") if not fx_closes.empty else "알 수 없음"
         components.html(f"""
         <div style="
             background: linear-gradient(135deg, #e8f5e9, #ffffff);
@@ -340,6 +538,14 @@ if ticker:
         st.warning("⚠️ 일드맥스 ETF 목록에 없는 티커입니다.")
     else:
         df_div_all, df_poly = build_hist_dividends_df(ticker)
+        get_schedule_inferrer().update(ticker, df_div_all)
+
+        # --- 실제 배당락일로 추론한 그룹이 있으면 그 그룹 달력 사용 (config 는 대체값) ---
+        추론키 = get_schedule_inferrer().inferred_group(ticker)
+        if 추론키 and 추론키 != 그룹키:
+            st.info(f"🔄 최근 배당락일 기준으로 {ticker} 는 {추론키} 주기로 배당 중입니다 (설정: {그룹키}).")
+            그룹키 = 추론키
+            그룹명, 그룹색 = GROUP_META[추론키]
         ex_dates_cfg, pay_dates_cfg, dec_dates_cfg = get_schedule(그룹키)
 
         # --- 최근·다음 날짜 구하기 (config 기준) ---
@@ -529,6 +735,20 @@ if ticker:
             </div>
             """, height=360)
 
+        # --- 관련 뉴스 ---
+        news_label = f"{ticker} · {UNDERLYING[ticker]}" if ticker in UNDERLYING else ticker
+        with st.expander(f"📰 관련 뉴스 ({news_label})", expanded=False):
+            news_items = get_news().latest(ticker, n=8)
+            if news_items:
+                for it in news_items:
+                    when = it["published"].astimezone(KST).strftime("%m/%d %H:%M") if it["published"] else ""
+                    title = escape_md(it["title"])
+                    link = safe_link(it["link"])
+                    st.markdown(f"- [{title}]({link})" if link else f"- {title}")
+                    st.caption(" · ".join(p for p in (escape_md(it["source"]), when) if p))
+            else:
+                st.info("뉴스를 수집 중입니다. 잠시 후 다시 확인해 주세요.")
+
         # --- 보유 주식 수 기준 수령액 ---
         st.markdown("### 💰 보유주식 수 기준 최근 배당 수령액")
         shares = st.number_input("보유 주식 수 입력", min_value=1, step=1, key="shares")
@@ -647,5 +867,113 @@ if ticker:
             st.plotly_chart(fig_div, use_container_width=True)
         else:
             st.warning("배당 데이터가 없습니다.")
+
+        # --- 전체 기간 차트 (다중 티커 비교) ---
+        with st.expander("📈 전체 기간 차트 (주가 + 배당, 여러 티커 비교)", expanded=False):
+            hist_tickers = st.multiselect("비교할 티커", sorted(TICKER_TO_GROUP), default=[ticker])
+            if hist_tickers:
+                firsts = [fetch_price_history(t).index.min() for t in hist_tickers]
+                firsts = [f for f in firsts if pd.notna(f)]
+                if firsts:
+                    first_day = min(firsts).date()
+                    if first_day < today_kst:
+                        default_start = max(first_day, today_kst - timedelta(days=365))
+                        vis_start, vis_end = st.slider(
+                            "표시 구간", min_value=first_day, max_value=today_kst,
+                            value=(default_start, today_kst), format="YYYY-MM-DD",
+                        )
+                    else:
+                        # 상장 당일 등 이력이 하루뿐이면 슬라이더(min == max)를 만들 수 없음
+                        vis_start, vis_end = first_day, first_day
+                        st.caption("주가 이력이 하루뿐이라 구간 선택 없이 표시합니다.")
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        max_points = st.select_slider("선당 최대 점 수", [300, 600, 1200], value=600)
+                    with c2:
+                        method = st.radio("다운샘플링", ["lttb", "minmax"], horizontal=True,
+                                          format_func=lambda m: "LTTB" if m == "lttb" else "Min-Max")
+                    with c3:
+                        normalize = st.checkbox("등락률(%)로 비교", value=len(hist_tickers) > 1)
+                        show_div = st.checkbox("배당 막대 표시", value=True)
+                    fig_hist = history_chart(
+                        tuple(hist_tickers), vis_start, vis_end, max_points, normalize, method, show_div,
+                    )
+                    st.plotly_chart(fig_hist, use_container_width=True)
+                else:
+                    st.info("선택한 티커의 주가 이력이 없습니다.")
 elif raw_input.strip():
     st.warning("영문 티커만 입력해 주세요. 예: TSLY, NVDY, ULTY")
+
+# -----------------------------
+# 전체 ETF 최소 투자금 배분
+# -----------------------------
+with st.expander("🧮 전체 ETF 최소 투자금 배분 (월 목표 배당)", expanded=False):
+    opt_target = st.number_input("월 목표 배당금 (원화 기준)", min_value=0, step=10000,
+                                 value=0, key="opt_target")
+    opt_max_w = st.slider("종목당 최대 비중(%)", min_value=5, max_value=100, value=20, step=5) / 100
+    opt_mix_on = st.checkbox("그룹 비중 지정", value=False)
+    opt_g1 = (st.slider("Group 1 비중(%)", min_value=0, max_value=100, value=30, step=5) / 100
+              if opt_mix_on else None)
+    opt_mode = st.segmented_control("계산 기준", ["세전", "세후"], default="세후", key="opt_mode")
+    if opt_target > 0:
+        try:
+            alloc, capital = compute_universe_allocation(
+                today_kst, round(float(LATEST_FX), 2), float(opt_target),
+                opt_max_w, opt_g1, opt_mode == "세후",
+            )
+        except ValueError as e:
+            alloc, capital = pd.DataFrame(), 0.0
+            st.warning(f"⚠️ {e}")
+        if not alloc.empty:
+            st.success(f"필요 투자금: **{capital:,.0f}원** (최근 13주 배당을 월 단위로 환산, {opt_mode} 기준)")
+            view = alloc[["그룹", "비중", "주가(달러)", "주식 수", "투자금", "월 배당(원)"]].copy()
+            view["비중"] = (view["비중"] * 100).round(1)
+            view["주식 수"] = view["주식 수"].round(0)
+            view["투자금"] = view["투자금"].round(0)
+            view["월 배당(원)"] = view["월 배당(원)"].round(0)
+            st.dataframe(view, use_container_width=True)
+            st.caption("⚠️ 과거 배당 기준 추정치이며, 향후 배당·주가·환율에 따라 달라질 수 있습니다.")
+        else:
+            st.info("배분 가능한 배당/가격 데이터가 없습니다.")
+    else:
+        st.caption("월 목표 배당금을 입력하면 전체 ETF 기준 최소 투자금 배분을 계산합니다.")
+
+# -----------------------------
+# 배당 스케줄 점검 (실제 배당락일 기반 추론)
+# -----------------------------
+with st.expander("📆 배당 스케줄 점검 (실제 배당락일 기반)", expanded=False):
+    seed_schedule_inferrer()
+    inferrer = get_schedule_inferrer()
+    if st.button("전체 ETF 이력 스캔"):
+        updated = inferrer.update_many({t: fetch_yf_dividends_df(t) for t in sorted(TICKER_TO_GROUP)})
+        st.caption(f"새 배당락일이 반영된 티커: {len(updated)}개")
+    sched = inferrer.summary()
+    if sched.empty:
+        st.info("아직 수집된 배당 이력이 없습니다 (일괄 다운로드 실패 시 config 스케줄을 그대로 사용). "
+                "티커를 조회하거나 전체 스캔을 실행하세요.")
+    else:
+        view = sched.copy()
+        view["요일"] = view["요일"].map(lambda d: WEEKDAY_KO[int(d)])
+        view["최근 배당락일"] = view["최근 배당락일"].dt.strftime("%Y-%m-%d")
+        mism = view[view["불일치"]]
+        if not mism.empty:
+            st.warning(f"⚠️ config 그룹과 다른 주기로 배당 중인 티커: {', '.join(mism.index)}")
+        st.dataframe(view, use_container_width=True)
+
+# -----------------------------
+# 캐시 상태 (사이드바)
+# -----------------------------
+with st.sidebar.expander("🧠 캐시 상태", expanded=False):
+    stats = get_memo().stats()
+    st.write(
+        f"사용량: {stats['used_bytes'] / 1024 / 1024:,.1f}MB / "
+        f"{stats['budget_bytes'] / 1024 / 1024:,.0f}MB ({stats['occupancy']:.1%})"
+    )
+    st.write(
+        f"항목 수: {stats['entries']} (고정 {stats['pinned']}, "
+        f"{stats['pinned_bytes'] / 1024 / 1024:,.1f}MB) · 정책: {stats['policy'].upper()}"
+    )
+    st.write(
+        f"적중 {stats['hits']:,} / 미적중 {stats['misses']:,} · "
+        f"제거 {stats['evictions']:,} / 만료 {stats['expirations']:,}"
+    )
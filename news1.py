@@ -0,0 +1,196 @@
+# news1.py — 티커별 뉴스 RSS 동시 수집 (조건부 GET + 중복 제거 + 티커별 고정 크기 버퍼)
+
+import hashlib
+import html
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from urllib.parse import quote, urlsplit
+
+import feedparser
+import requests
+
+USER_AGENT = "Mozilla/5.0 (YieldmaxDividendFinder news)"
+
+def item_digest(entry) -> str:
+    """피드가 달라도 같은 기사면 같은 값 (공백·대소문자·출처 꼬리표 무시한 제목 해시)"""
+    title = (entry.get("title") or "").lower()
+    title = re.sub(r"\s+-\s+[^-]+$", "", title)      # Google News 의 ' - 출처' 꼬리표 제거
+    title = re.sub(r"\W+", " ", title).strip()
+    key = title or entry.get("id") or entry.get("link") or ""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def escape_md(text: str) -> str:
+    """피드 문자열을 마크다운 텍스트로 안전하게 (HTML 이스케이프 + 마크다운 특수문자 이스케이프)"""
+    text = html.escape(text or "", quote=False)
+    return re.sub(r"([\\`*_\[\]()~|])", r"\\\1", text)
+
+def safe_link(url: str) -> Optional[str]:
+    """http/https 링크만 허용, 괄호·공백 등은 퍼센트 인코딩 (그 외 스킴은 None)"""
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return quote(url, safe=":/?&=#%+@,;~.-_!*'")
+
+def _published(entry) -> Optional[datetime]:
+    t = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not t:
+        return None
+    return datetime(*t[:6], tzinfo=timezone.utc)
+
+
+class FeedAggregator:
+    """
+    - 피드 URL 단위로 한 번만 요청 (같은 기초자산을 쓰는 펀드끼리 공유)
+    - ETag / Last-Modified 로 조건부 GET, 304 면 파싱 생략
+    - 피드 순서(최신순/관련도순)에 기대지 않고 URL 별 직전 응답의 해시 집합으로 이미 본 항목만 건너뜀
+      (버퍼에서 밀려난 항목도 피드에 남아 있는 동안은 다시 추가되지 않음)
+    - 티커별 최근 per_ticker 건만 보관: 구독 피드마다 몫(per_ticker // 피드 수)을 먼저 채우고
+      남는 자리는 전체 최신순 — 항목 많은 기초자산 피드가 펀드 자체 피드를 밀어내지 않음
+    - 페이지 렌더링은 latest() 로 메모리만 읽음
+    """
+    def __init__(self, templates: List[str], symbols: Dict[str, List[str]],
+                 per_ticker: int = 30, max_workers: int = 8, timeout: float = 8.0):
+        self.per_ticker = per_ticker
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # URL → 이 피드를 구독하는 티커들
+        self._subscribers: Dict[str, Set[str]] = {}
+        # 티커 → 구독 피드 URL
+        self._feeds: Dict[str, Set[str]] = {t: set() for t in symbols}
+        for ticker, syms in symbols.items():
+            for sym in syms:
+                for tpl in templates:
+                    url = tpl.format(symbol=sym)
+                    self._subscribers.setdefault(url, set()).add(ticker)
+                    self._feeds[ticker].add(url)
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._seen: Dict[str, Set[str]] = {}                       # URL → 직전 응답의 항목 해시
+        self._buffers: Dict[str, Dict[str, dict]] = {t: {} for t in symbols}   # 티커 → 해시 → 항목
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+        self.last_poll: Optional[float] = None
+
+    def _session(self) -> requests.Session:
+        s = getattr(self._local, "session", None)
+        if s is None:
+            s = requests.Session()
+            s.headers["User-Agent"] = USER_AGENT
+            self._local.session = s
+        return s
+
+    # -----------------------------
+    # 수집
+    # -----------------------------
+    def _fetch(self, url: str):
+        headers = {}
+        v = self._validators.get(url, {})
+        if v.get("etag"):
+            headers["If-None-Match"] = v["etag"]
+        if v.get("modified"):
+            headers["If-Modified-Since"] = v["modified"]
+        try:
+            r = self._session().get(url, headers=headers, timeout=self.timeout)
+        except Exception:
+            return url, None
+        if r.status_code != 200:      # 304 Not Modified 포함
+            return url, None
+        self._validators[url] = {
+            "etag": r.headers.get("ETag", ""),
+            "modified": r.headers.get("Last-Modified", ""),
+        }
+        return url, r.content
+
+    def _ingest(self, url: str, content: bytes) -> int:
+        parsed = feedparser.parse(content)
+        source = parsed.feed.get("title", "")
+        items = {}
+        for entry in parsed.entries:
+            items.setdefault(item_digest(entry), {
+                "title": entry.get("title", ""),
+                "link": entry.get("link", ""),
+                "published": _published(entry),
+                "source": source,
+                "feed": url,
+            })
+        if not items:
+            return 0
+
+        added = 0
+        with self._lock:
+            seen = self._seen.get(url, set())
+            self._seen[url] = set(items)
+            fresh = {d: it for d, it in items.items() if d not in seen}
+            if not fresh:
+                return 0
+            for ticker in self._subscribers[url]:
+                buf = self._buffers[ticker]
+                new = [d for d in fresh if d not in buf]      # 다른 피드로 이미 들어온 기사는 건너뜀
+                for d in new:
+                    buf[d] = fresh[d]
+                self._trim(ticker)
+                added += sum(1 for d in new if d in self._buffers[ticker])
+        return added
+
+    def _trim(self, ticker: str) -> None:
+        """per_ticker 초과분 정리: 피드별 몫을 최신순으로 먼저 채우고 나머지는 전체 최신순"""
+        buf = self._buffers[ticker]
+        if len(buf) <= self.per_ticker:
+            return
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        ordered = sorted(buf, key=lambda d: buf[d]["published"] or epoch, reverse=True)
+        quota = max(1, self.per_ticker // max(1, len(self._feeds[ticker])))
+        taken = Counter()
+        keep = []
+        for d in ordered:
+            if taken[buf[d]["feed"]] < quota:
+                taken[buf[d]["feed"]] += 1
+                keep.append(d)
+        kept = set(keep)
+        keep += [d for d in ordered if d not in kept]
+        self._buffers[ticker] = {d: buf[d] for d in keep[:self.per_ticker]}
+
+    def poll_once(self) -> int:
+        """모든 피드를 동시에 조회하고 새로 추가된 항목 수 반환"""
+        added = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            for url, content in ex.map(self._fetch, list(self._subscribers)):
+                if content:
+                    try:
+                        added += self._ingest(url, content)
+                    except Exception:
+                        continue
+        self.last_poll = time.time()
+        return added
+
+    def start(self, interval: float = 600.0) -> None:
+        """백그라운드 스레드에서 interval 초마다 poll_once (중복 시작 방지)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        def _loop():
+            while True:
+                try:
+                    self.poll_once()
+                except Exception:
+                    pass
+                time.sleep(interval)
+
+        self._thread = threading.Thread(target=_loop, name="news-poller", daemon=True)
+        self._thread.start()
+
+    # -----------------------------
+    # 조회 (메모리만)
+    # -----------------------------
+    def latest(self, ticker: str, n: int = 10) -> List[dict]:
+        with self._lock:
+            items = list(self._buffers.get(ticker, {}).values())
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        items.sort(key=lambda it: it["published"] or epoch, reverse=True)
+        return items[:n]
@@ -0,0 +1,106 @@
+# optimizer1.py — 목표 월 배당(원화) 달성을 위한 최소 투자금 배분
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+# -----------------------------
+# 배당·가격 행렬
+# -----------------------------
+def build_dividend_matrix(div_frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """티커별 배당 DataFrame(배당락일, 배당금(달러)) → 행: 배당락일(일 단위), 열: 티커 행렬"""
+    parts = []
+    for t, df in div_frames.items():
+        if df is None or df.empty:
+            continue
+        s = pd.Series(
+            pd.to_numeric(df["배당금(달러)"], errors="coerce").to_numpy(),
+            index=pd.to_datetime(df["배당락일"]).dt.tz_localize(None).dt.normalize(),
+            name=t,
+        )
+        parts.append(s.groupby(level=0).sum())
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, axis=1).sort_index().fillna(0.0)
+
+
+def trailing_monthly_dividend(div_matrix: pd.DataFrame, asof: pd.Timestamp, window_days: int = 91) -> pd.Series:
+    """asof 기준 최근 window_days 배당 합계를 월(30.4일) 단위로 환산한 1주당 배당(달러)"""
+    if div_matrix.empty:
+        return pd.Series(dtype=float)
+    asof = pd.Timestamp(asof)
+    if asof.tzinfo is not None:
+        asof = asof.tz_localize(None)
+    asof = asof.normalize()
+    idx = div_matrix.index.values
+    mask = (idx > np.datetime64(asof - pd.Timedelta(days=window_days))) & (idx <= np.datetime64(asof))
+    total = div_matrix.to_numpy()[mask].sum(axis=0)
+    return pd.Series(total * (30.4 / window_days), index=div_matrix.columns)
+
+# -----------------------------
+# 최적화
+# -----------------------------
+def _fill_greedy(yields: pd.Series, budget: float, max_weight: float) -> pd.Series:
+    """수익률 높은 순으로 max_weight 까지 채워 budget(비중 합) 배분 — 분할 배낭 문제의 최적해"""
+    w = pd.Series(0.0, index=yields.index)
+    remaining = budget
+    for t in yields.sort_values(ascending=False).index:
+        if remaining <= 1e-12:
+            break
+        take = min(max_weight, remaining)
+        w[t] = take
+        remaining -= take
+    if remaining > 1e-9:
+        raise ValueError("제약 조건을 만족하는 배분이 없습니다 (펀드 수 대비 최대 비중이 너무 작음).")
+    return w
+
+
+def optimize_allocation(
+    monthly_div_usd: pd.Series,
+    prices_usd: pd.Series,
+    groups: pd.Series,
+    target_krw: float,
+    fx: float,
+    max_weight: float = 0.2,
+    group_mix: Optional[Dict[str, float]] = None,
+    tax_rate: float = 0.0,
+) -> Tuple[pd.DataFrame, float]:
+    """
+    월 목표 배당(target_krw)을 최소 투자금으로 달성하는 배분 계산.
+    - 투자금 최소화 = 포트폴리오 월 수익률 최대화 (비중 합 1, 펀드별 ≤ max_weight)
+    - group_mix 가 있으면 그룹별 비중 합을 고정 (예: {'G1': 0.3, 'G2': 0.7})
+    반환: (배분표, 총 투자금(원))
+    """
+    df = pd.DataFrame({"배당(달러)": monthly_div_usd, "주가(달러)": prices_usd, "그룹": groups}).dropna()
+    df = df[(df["배당(달러)"] > 0) & (df["주가(달러)"] > 0)]
+    if df.empty or target_krw <= 0:
+        return pd.DataFrame(), 0.0
+
+    yields = df["배당(달러)"] * (1 - tax_rate) / df["주가(달러)"]
+
+    if group_mix:
+        weights = pd.Series(0.0, index=df.index)
+        for g, share in group_mix.items():
+            if share <= 0:
+                continue
+            in_group = df.index[df["그룹"] == g]
+            weights[in_group] = _fill_greedy(yields[in_group], share, max_weight)
+    else:
+        weights = _fill_greedy(yields, 1.0, max_weight)
+
+    port_yield = float((weights * yields).sum())
+    if port_yield <= 0:
+        return pd.DataFrame(), 0.0
+    capital = target_krw / port_yield
+
+    out = df.assign(
+        비중=weights,
+        월수익률=yields,
+        투자금=weights * capital,
+    )
+    out = out[out["비중"] > 0].copy()
+    out["주식 수"] = out["투자금"] / (out["주가(달러)"] * fx)
+    out["월 배당(원)"] = out["투자금"] * out["월수익률"]
+    out = out.sort_values("비중", ascending=False)
+    out.index.name = "티커"
+    return out, capital
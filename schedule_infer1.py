@@ -0,0 +1,156 @@
+# schedule_infer1.py — 실제 배당락일 이력으로 그룹·주기 자동 추론
+
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from config1 import SCHEDULE, TICKER_TO_GROUP, generate_weekly, parse_schedule
+
+WEEKDAY_KO = ['월', '화', '수', '목', '금', '토', '일']
+
+# -----------------------------
+# config 기준 그룹 패턴 (요일·선언/지급 간격)
+# -----------------------------
+def _group_patterns() -> Dict[str, Dict[str, int]]:
+    """SCHEDULE 첫 항목에서 그룹별 배당락 요일과 선언일/지급일 간격(일) 추출"""
+    out = {}
+    for g, v in SCHEDULE.items():
+        if not v['ex_dates']:
+            continue
+        ex0 = v['ex_dates'][0]
+        dec0 = v['dec_dates'][0] if v['dec_dates'] else ex0 - pd.Timedelta(days=1)
+        pay0 = v['pay_dates'][0] if v['pay_dates'] else ex0 + pd.Timedelta(days=1)
+        out[g] = {
+            'weekday': ex0.weekday(),
+            'dec_offset': (dec0 - ex0).days,
+            'pay_offset': (pay0 - ex0).days,
+        }
+    return out
+
+GROUP_PATTERNS = _group_patterns()
+WEEKDAY_TO_GROUP = {p['weekday']: g for g, p in GROUP_PATTERNS.items()}
+
+# -----------------------------
+# 일괄 요약 (벡터화)
+# -----------------------------
+def summarize_ex_dates(events: pd.DataFrame, recent_n: int = 8) -> pd.DataFrame:
+    """
+    events(티커, 배당락일) → 티커별 최빈 요일·주기(일)·추론 그룹·config 그룹·불일치 여부.
+    최근 recent_n 건만 사용하므로 과거 주기 변경(월배당 → 주배당)에 끌려가지 않음.
+    """
+    cols = ['티커', '요일', '주기(일)', '건수', '최근 배당락일', '추론 그룹', '설정 그룹', '불일치']
+    if events.empty:
+        return pd.DataFrame(columns=cols).set_index('티커')
+
+    ev = events.sort_values(['티커', '배당락일'])
+    ev = ev.groupby('티커', sort=False).tail(recent_n).copy()
+    ev['요일'] = ev['배당락일'].dt.weekday
+    ev['간격'] = ev.groupby('티커')['배당락일'].diff().dt.days
+
+    g = ev.groupby('티커')
+    summary = pd.DataFrame({
+        '요일': g['요일'].agg(lambda s: int(np.bincount(s.to_numpy(), minlength=7).argmax())),
+        '주기(일)': g['간격'].median(),
+        '건수': g.size(),
+        '최근 배당락일': g['배당락일'].max(),
+    })
+    weekly = summary['주기(일)'].between(6, 8)
+    summary['추론 그룹'] = summary['요일'].map(WEEKDAY_TO_GROUP).where(weekly)
+    summary['설정 그룹'] = pd.Series({t: v[0] for t, v in TICKER_TO_GROUP.items()}).reindex(summary.index)
+    summary['불일치'] = summary['추론 그룹'].notna() & (summary['추론 그룹'] != summary['설정 그룹'])
+    summary.index.name = '티커'
+    return summary[cols[1:]]
+
+# -----------------------------
+# 증분 추론기
+# -----------------------------
+class ScheduleInferrer:
+    """
+    티커별 배당 이력을 받아 새로 들어온 배당락일만 누적하고,
+    변경된 티커만 다시 요약한다 (페이지 조회 중 이미 받은 데이터만 사용).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = pd.DataFrame({'티커': pd.Series(dtype=str),
+                                     '배당락일': pd.Series(dtype='datetime64[ns]')})
+        self._last_seen: Dict[str, pd.Timestamp] = {}
+        self._summary = summarize_ex_dates(self._events)
+
+    def update(self, ticker: str, df_div: pd.DataFrame) -> bool:
+        """df_div(배당락일, 배당금(달러))에서 새 배당락일만 반영. 변경 시 True"""
+        if df_div is None or df_div.empty:
+            return False
+        ex = pd.to_datetime(df_div['배당락일'])
+        if ex.dt.tz is not None:
+            ex = ex.dt.tz_localize(None)
+        ex = ex.dt.normalize()
+        amt = pd.to_numeric(df_div['배당금(달러)'], errors='coerce')
+        ex = ex[amt.fillna(0).to_numpy() > 0]
+        with self._lock:
+            last = self._last_seen.get(ticker)
+            new = ex[ex > last] if last is not None else ex
+            new = new.drop_duplicates()
+            if new.empty:
+                return False
+            self._events = pd.concat(
+                [self._events, pd.DataFrame({'티커': ticker, '배당락일': new.to_numpy()})],
+                ignore_index=True,
+            )
+            self._last_seen[ticker] = new.max()
+            changed = summarize_ex_dates(self._events[self._events['티커'] == ticker])
+            rest = self._summary.drop(ticker, errors='ignore')
+            # 빈 프레임과 concat 하면 날짜 열이 object 로 바뀌므로 비어 있으면 그대로 교체
+            self._summary = changed if rest.empty else pd.concat([rest, changed]).sort_index()
+            return True
+
+    def update_many(self, frames: Dict[str, pd.DataFrame]) -> List[str]:
+        return [t for t, df in frames.items() if self.update(t, df)]
+
+    def summary(self) -> pd.DataFrame:
+        with self._lock:
+            return self._summary.copy()
+
+    def mismatches(self) -> pd.DataFrame:
+        s = self.summary()
+        return s[s['불일치']]
+
+    def inferred_group(self, ticker: str) -> Optional[str]:
+        """실제 배당락일로 추론한 그룹 (주배당이 아니거나 이력이 없으면 None)"""
+        s = self.summary()
+        if ticker not in s.index:
+            return None
+        g = s.at[ticker, '추론 그룹']
+        return None if pd.isna(g) else g
+
+    def group_anchor(self, group_key: str) -> Optional[pd.Timestamp]:
+        """
+        해당 그룹으로 추론된 티커들의 최신 배당락일을 그룹 최빈 요일로 맞춘 날짜.
+        휴장일 때문에 하루 당겨지거나 밀린 배당락일이 이후 스케줄 요일을 바꾸지 않도록 함.
+        """
+        s = self.summary()
+        if s.empty:
+            return None
+        rows = s[s['추론 그룹'] == group_key]
+        if rows.empty:
+            return None
+        latest = rows['최근 배당락일'].max()
+        weekday = int(np.bincount(rows['요일'].astype(int).to_numpy(), minlength=7).argmax())
+        shift = (weekday - latest.weekday() + 3) % 7 - 3      # -3 ~ +3 일 중 가장 가까운 쪽
+        return latest + pd.Timedelta(days=shift)
+
+    def group_schedule(self, group_key: str, weeks_back: int = 26,
+                       weeks_ahead: int = 26) -> Optional[Dict[str, List[pd.Timestamp]]]:
+        """group_anchor 기준 앞뒤 주간 스케줄 생성 (SCHEDULE 형식)"""
+        pat = GROUP_PATTERNS.get(group_key)
+        anchor = self.group_anchor(group_key)
+        if pat is None or anchor is None:
+            return None
+        start_ex = anchor - pd.Timedelta(weeks=weeks_back)
+        raw = generate_weekly(
+            start_decl=start_ex + pd.Timedelta(days=pat['dec_offset']),
+            start_ex=start_ex,
+            start_pay=start_ex + pd.Timedelta(days=pat['pay_offset']),
+            weeks=weeks_back + weeks_ahead + 1,
+        )
+        return parse_schedule({group_key: raw})[group_key]
@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cache1 import DiskBackend, HttpBackend, MemoryBudgetCache, SharedCache, estimate_size
+
+
+class _KVHandler(BaseHTTPRequestHandler):
+    """네트워크 KV 대역: GET/PUT/DELETE /kv/<key>"""
+    def _key(self):
+        return unquote(self.path.split("/kv/", 1)[1])
+
+    def do_GET(self):
+        self.server.gets += 1
+        v = self.server.store.get(self._key())
+        if v is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(v)))
+        self.end_headers()
+        self.wfile.write(v)
+
+    def do_PUT(self):
+        self.server.store[self._key()] = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(204)
+        self.end_headers()
+
+    def do_DELETE(self):
+        found = self.server.store.pop(self._key(), None) is not None
+        self.send_response(204 if found else 404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def kv_server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _KVHandler)
+    srv.store, srv.gets = {}, 0
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+
+
+@pytest.fixture
+def http_backend(kv_server):
+    return HttpBackend(f"http://127.0.0.1:{kv_server.server_port}/kv")
+
+
+def _dividends():
+    return pd.DataFrame({
+        "배당락일": pd.date_range("2026-09-03", periods=4, freq="7D", tz="Asia/Seoul"),
+        "배당금(달러)": [0.41, np.nan, 0.38, 0.40],
+    })
+
+
+def test_http_backend_roundtrip(http_backend):
+    assert http_backend.get("a:b/c") is None
+    http_backend.set("a:b/c", b"xyz", ttl=60)
+    assert http_backend.get("a:b/c") == b"xyz"
+    http_backend.delete("a:b/c")
+    assert http_backend.get("a:b/c") is None
+
+
+def test_shared_cache_loads_once_and_stores_json(kv_server, http_backend):
+    cache = SharedCache(http_backend)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _dividends()
+
+    first = cache.get_or_load("yf_div:TSLY", 60, loader)
+    second = cache.get_or_load("yf_div:TSLY", 60, loader)
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(second, _dividends())
+
+    raw = kv_server.store["ymdf:v0:yf_div:TSLY"]
+    assert json.loads(raw)["value"]["t"] == "df"
+
+
+def test_shared_cache_hit_is_one_round_trip(kv_server, http_backend):
+    cache = SharedCache(http_backend, version_ttl=60)
+    cache.get_or_load("fx:USDKRW", 60, lambda: 1400.5)
+    before = kv_server.gets
+    assert cache.get_or_load("fx:USDKRW", 60, lambda: 0.0) == 1400.5
+    assert kv_server.gets - before == 1
+
+
+def test_bump_version_is_seen_by_other_replicas(http_backend):
+    a = SharedCache(http_backend, version_ttl=0)
+    b = SharedCache(http_backend, version_ttl=0)
+    a.get_or_load("k", 60, lambda: "old")
+    b.bump_version()
+    assert a.get_or_load("k", 60, lambda: "new") == "new"
+
+
+def test_load_straddling_bump_is_not_written(http_backend):
+    a = SharedCache(http_backend, version_ttl=0)
+    b = SharedCache(http_backend, version_ttl=0)
+
+    def loader():
+        b.bump_version()
+        return "stale"
+
+    assert a.get_or_load("k", 60, loader) == "stale"
+    assert a.get("k", 60) is None
+
+
+def test_unsupported_values_are_not_cached(http_backend):
+    cache = SharedCache(http_backend)
+    assert cache.set("obj", object(), 60) is False
+    assert cache.get("obj", 60) is None
+
+
+def test_disk_backend_prunes_expired_rows(tmp_path):
+    backend = DiskBackend(str(tmp_path / "c.db"))
+    backend.set("old", b"1", ttl=0.01)
+    backend.set("fresh", b"2", ttl=60)
+    time.sleep(0.02)
+    assert backend.get("old") is None
+    assert backend.prune() == 1
+    assert backend.get("fresh") == b"2"
+
+
+def test_memory_budget_is_enforced_with_pinned_entries():
+    cache = MemoryBudgetCache(1000, pin_fraction=0.5)
+    for i in range(20):
+        cache.set(f"pin{i}", "x" * 80, 60, pin=True)
+    for i in range(20):
+        cache.set(f"k{i}", "y" * 80, 60)
+    stats = cache.stats()
+    assert stats["used_bytes"] <= 1000
+    assert stats["pinned_bytes"] <= 500
+
+
+def test_lru_keeps_recently_used_and_pinned():
+    item = MemoryBudgetCache(0).entry_size("hot", "a" * 80)
+    cache = MemoryBudgetCache(3 * item + item // 2)
+    cache.set("hot", "h" * 80, 60, pin=True)
+    cache.set("a", "a" * 80, 60)
+    cache.set("b", "b" * 80, 60)
+    cache.get("a")
+    cache.set("c", "c" * 80, 60)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("hot") is not None
+
+
+def test_lfu_does_not_evict_the_new_entry():
+    probe = MemoryBudgetCache(0, policy="lfu")
+    budget = probe.entry_size("a", "a" * 80) * 2 + probe.entry_size("c", "c" * 120) // 2
+    cache = MemoryBudgetCache(budget, policy="lfu")
+    cache.set("a", "a" * 80, 60)
+    cache.get("a")
+    cache.set("b", "b" * 80, 60)
+    cache.set("c", "c" * 120, 60)
+    assert cache.get("c") is not None
+    assert cache.get("b") is None
+
+
+def test_small_values_count_against_budget():
+    # get_price_on_date 처럼 float·None 을 키마다 저장해도 항목 수·실제 메모리가 예산 안에 머물러야 함
+    budget = 1 << 20
+    cache = MemoryBudgetCache(budget)
+    tracemalloc.start()
+    for i in range(100_000):
+        cache.set(f"price:TSLY:{i:06d}", None if i % 2 else float(i), 3600)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = cache.stats()
+    assert stats["used_bytes"] <= budget
+    assert stats["entries"] <= budget // 200
+    assert traced <= 1.5 * budget
+
+
+def test_expired_entries_are_dropped_lazily():
+    cache = MemoryBudgetCache(1000)
+    cache.set("k", 1.0, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("k") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_estimate_size_sums_dataframes_in_dict():
+    frames = {t: pd.DataFrame({"Close": np.arange(1000, dtype=float)}) for t in ("A", "B")}
+    assert estimate_size(frames) >= 2 * frames["A"].memory_usage(deep=True).sum()
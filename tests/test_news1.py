@@ -0,0 +1,119 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from news1 import FeedAggregator, escape_md, safe_link
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    """로컬 RSS 대역: 항목 목록이 바뀔 때만 ETag 가 바뀌고, 같으면 304 (srv.feeds 로 심볼별 항목·날짜 지정)"""
+    def do_GET(self):
+        srv = self.server
+        sym = parse_qs(urlsplit(self.path).query).get("s", [""])[0]
+        titles, day = srv.feeds.get(sym, (srv.titles, 5))
+        etag = f'"{srv.version}"'
+        if srv.use_etag and self.headers.get("If-None-Match") == etag:
+            srv.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        srv.full += 1
+        items = "".join(
+            f"<item><title>{t}</title><link>http://news.local/{i}</link>"
+            f"<pubDate>{day:02d} Oct 2026 {10 + i // 60:02d}:{i % 60:02d}:00 GMT</pubDate></item>"
+            for i, t in enumerate(titles)
+        )
+        body = (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Local</title>'
+                f"{items}</channel></rss>").encode()
+        self.send_response(200)
+        if srv.use_etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    srv.titles, srv.version, srv.full, srv.not_modified = ["Tesla rallies - Reuters", "Nvidia beats"], 1, 0, 0
+    srv.feeds, srv.use_etag = {}, True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+
+
+def _aggregator(srv, per_ticker=30):
+    base = f"http://127.0.0.1:{srv.server_port}"
+    return FeedAggregator(
+        [base + "/a?s={symbol}", base + "/b?s={symbol}"],
+        {"TSLY": ["TSLY", "TSLA"], "CRSH": ["CRSH", "TSLA"]},
+        per_ticker=per_ticker,
+    )
+
+
+def test_conditional_get_and_cross_feed_dedup(feed_server):
+    agg = _aggregator(feed_server)
+    agg.poll_once()
+    # TSLA 피드는 두 펀드가 공유 → URL 6개만 요청
+    assert feed_server.full == 6
+    assert sorted(i["title"] for i in agg.latest("TSLY")) == ["Nvidia beats", "Tesla rallies - Reuters"]
+
+    assert agg.poll_once() == 0
+    assert feed_server.not_modified == 6
+    assert feed_server.full == 6
+
+
+def test_new_items_after_old_ones_are_kept(feed_server):
+    agg = _aggregator(feed_server)
+    agg.poll_once()
+    # 관련도순 피드: 새 기사가 기존 기사 뒤에 나타남
+    feed_server.titles = feed_server.titles + ["Late relevance pick"]
+    feed_server.version += 1
+    agg.poll_once()
+    assert "Late relevance pick" in {i["title"] for i in agg.latest("CRSH")}
+
+
+def test_buffer_is_bounded(feed_server):
+    feed_server.titles = [f"Story {i}" for i in range(10)]
+    agg = _aggregator(feed_server, per_ticker=3)
+    agg.poll_once()
+    assert len(agg.latest("TSLY", n=100)) == 3
+
+
+def test_unchanged_large_feed_adds_nothing_without_etag(feed_server):
+    # 피드 항목(50) > per_ticker(30): 버퍼에서 밀려난 항목이 다음 폴링에 다시 들어오면 안 됨
+    feed_server.use_etag = False
+    feed_server.titles = [f"Story {i}" for i in range(50)]
+    agg = _aggregator(feed_server)
+    assert agg.poll_once() > 0
+    before = agg.latest("TSLY", n=100)
+    assert agg.poll_once() == 0
+    assert agg.poll_once() == 0
+    assert agg.latest("TSLY", n=100) == before
+
+
+def test_small_fund_feed_is_not_crowded_out(feed_server):
+    # 기초자산 피드가 더 최신이고 항목도 많아도 펀드 자체 피드 기사는 남아야 함
+    feed_server.feeds = {
+        "TSLY": ([f"Fund note {i}" for i in range(5)], 4),
+        "TSLA": ([f"Tesla story {i}" for i in range(50)], 5),
+    }
+    base = f"http://127.0.0.1:{feed_server.server_port}"
+    agg = FeedAggregator([base + "/a?s={symbol}"], {"TSLY": ["TSLY", "TSLA"]}, per_ticker=30)
+    agg.poll_once()
+    titles = [i["title"] for i in agg.latest("TSLY", n=100)]
+    assert len(titles) == 30
+    assert sum(t.startswith("Fund note") for t in titles) == 5
+
+
+def test_render_helpers_reject_untrusted_markup():
+    assert safe_link("javascript:alert(1)") is None
+    assert safe_link("http://x.test/a (b)") == "http://x.test/a%20%28b%29"
+    escaped = escape_md("<img src=x onerror=alert(1)> [x](y)")
+    assert "<" not in escaped and "\\[" in escaped and "\\(" in escaped
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from schedule_infer1 import GROUP_PATTERNS, ScheduleInferrer
+
+
+def _history(first_ex, weeks=10, shift_last_days=0):
+    ex = list(pd.date_range(first_ex, periods=weeks, freq="7D", tz="Asia/Seoul"))
+    ex[-1] = ex[-1] + pd.Timedelta(days=shift_last_days)
+    return pd.DataFrame({"배당락일": ex, "배당금(달러)": 0.5})
+
+
+def test_holiday_shifted_ex_date_keeps_group_weekday():
+    g2_weekday = GROUP_PATTERNS["G2"]["weekday"]
+    first = pd.Timestamp("2026-07-02")
+    first += pd.Timedelta(days=(g2_weekday - first.weekday()) % 7)
+    inferrer = ScheduleInferrer()
+    inferrer.update("TSLY", _history(first, shift_last_days=-1))   # 마지막 배당락일만 하루 당겨짐
+
+    anchor = inferrer.group_anchor("G2")
+    assert anchor.weekday() == g2_weekday
+    sched = inferrer.group_schedule("G2")
+    assert {d.weekday() for d in sched["ex_dates"]} == {g2_weekday}
+
+
+def test_moved_fund_reports_inferred_group():
+    g1_weekday = GROUP_PATTERNS["G1"]["weekday"]
+    first = pd.Timestamp("2026-07-01")
+    first += pd.Timedelta(days=(g1_weekday - first.weekday()) % 7)
+    inferrer = ScheduleInferrer()
+    inferrer.update("TSLY", _history(first))                        # config 는 G2
+
+    assert inferrer.inferred_group("TSLY") == "G1"
+    assert bool(inferrer.mismatches().loc["TSLY", "불일치"])
+    assert inferrer.inferred_group("NVDY") is None